@@ -561,11 +561,7 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
             A set of all the sub-types extending the provided type, including
             the input `entry_type` itself.
         """
-        all_types: Set[Type] = set()
-        for data_type in self._index.indexed_types():
-            if issubclass(data_type, entry_type):
-                all_types.add(data_type)
-        return all_types
+        return set(self._index.query_sub_types(entry_type))
 
     def get_entries_of(
         self, entry_type: Type[EntryType], exclude_sub_types=False
@@ -35,11 +35,11 @@ class BaseStore:
     @abstractmethod
     def add_annotation_raw(self, type_name: str, begin: int, end: int) -> int:
         r"""This function adds an annotation entry with `begin` and `end`
-        indices to the `type_name` sortedlist in `self.__elements`,
+        indices to the `type_name` columns in `self.__elements`,
         returns the `tid` for the inserted entry.
 
         Args:
-            type_name (str): The index of Annotation sortedlist in `self.__elements`.
+            type_name (str): The index of Annotation columns in `self.__elements`.
             begin (int): Begin index of the entry.
             end (int): End index of the entry.
         Returns:
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import functools
 import logging
 from typing import List, Tuple, Any, Optional, Union, Dict, Sequence
 
@@ -24,7 +25,75 @@ from forte.data.types import MatrixLike
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["Converter"]
+__all__ = ["Converter", "to_numpy", "to_torch"]
+
+
+@functools.singledispatch
+def to_numpy(data: MatrixLike, dtype=None) -> np.ndarray:
+    r"""Convert a `MatrixLike` object to a `numpy.ndarray`. Arrays that
+    already have the requested `dtype` are returned as is, and tensors on
+    CPU share their memory with the returned array.
+
+    Args:
+        data: A nested list, a `numpy.ndarray` or a `torch.Tensor`.
+        dtype: The dtype of the result, the dtype of `data` is kept when it
+            is None.
+
+    Returns:
+        The `numpy.ndarray` holding `data`.
+    """
+    return np.array(data, dtype=dtype)
+
+
+@to_numpy.register(np.ndarray)
+def _ndarray_to_numpy(data: np.ndarray, dtype=None) -> np.ndarray:
+    return np.asarray(data, dtype=dtype)
+
+
+@to_numpy.register(torch.Tensor)
+def _tensor_to_numpy(data: torch.Tensor, dtype=None) -> np.ndarray:
+    return np.asarray(data.detach().cpu().numpy(), dtype=dtype)
+
+
+@functools.singledispatch
+def to_torch(
+    data: MatrixLike,
+    dtype: Optional[torch.dtype] = None,
+    device: Optional[torch.device] = None,
+) -> torch.Tensor:
+    r"""Convert a `MatrixLike` object to a `torch.Tensor`. Tensors that
+    already have the requested `dtype` and `device` are returned as is, and
+    `numpy.ndarray` are wrapped without copy when they stay on CPU.
+
+    Args:
+        data: A nested list, a `numpy.ndarray` or a `torch.Tensor`.
+        dtype: The dtype of the result, the dtype of `data` is kept when it
+            is None.
+        device: The device of the result, the tensor is created on CPU (or
+            kept on its device) when it is None.
+
+    Returns:
+        The `torch.Tensor` holding `data`.
+    """
+    return torch.tensor(data, dtype=dtype, device=device)
+
+
+@to_torch.register(np.ndarray)
+def _ndarray_to_torch(
+    data: np.ndarray,
+    dtype: Optional[torch.dtype] = None,
+    device: Optional[torch.device] = None,
+) -> torch.Tensor:
+    return torch.from_numpy(data).to(device=device, dtype=dtype)
+
+
+@to_torch.register(torch.Tensor)
+def _tensor_to_torch(
+    data: torch.Tensor,
+    dtype: Optional[torch.dtype] = None,
+    device: Optional[torch.device] = None,
+) -> torch.Tensor:
+    return data.to(device=device, dtype=dtype)
 
 
 class Converter:
@@ -342,8 +411,8 @@ class Converter:
 
     @staticmethod
     def _to_numpy_type(data: List[Any], dtype) -> np.ndarray:
-        return np.array(data, dtype=dtype)
+        return to_numpy(data, dtype)
 
     @staticmethod
     def _to_tensor_type(data: List[Any], dtype) -> torch.Tensor:
-        return torch.tensor(data, dtype=dtype)
+        return to_torch(data, dtype)
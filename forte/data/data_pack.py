@@ -49,7 +49,7 @@ from forte.data.ontology.top import (
     AudioAnnotation,
 )
 from forte.data.span import Span
-from forte.data.types import ReplaceOperationsType, DataRequest
+from forte.data.types import ReplaceOperationsType, ReplaceOps, DataRequest
 from forte.utils import get_class
 
 logger = logging.getLogger(__name__)
@@ -168,6 +168,9 @@ class DataPack(BasePack[Entry, Link, Group]):
 
         self.__replace_back_operations: ReplaceOperationsType = []
         self.__processed_original_spans: List[Tuple[Span, Span]] = []
+        # The column form of `__replace_back_operations`, built on demand by
+        # `get_original_span` and not serialized.
+        self.__replace_back_ops: Optional[ReplaceOps] = None
 
         self.__orig_text_len: int = 0
 
@@ -178,8 +181,10 @@ class DataPack(BasePack[Entry, Link, Group]):
         In serialization,
             1) will serialize the annotation sorted list as a normal list;
             2) will not serialize the indices
+            3) will not serialize the cached replace back operations
         """
         state = super().__getstate__()
+        state.pop("_DataPack__replace_back_ops", None)
         state["annotations"] = list(state["annotations"])
         state["links"] = list(state["links"])
         state["groups"] = list(state["groups"])
@@ -207,6 +212,7 @@ class DataPack(BasePack[Entry, Link, Group]):
             )
         if "orig_text_len" in self.__dict__:
             self.__orig_text_len = self.__dict__.pop("orig_text_len")
+        self.__replace_back_ops = None
 
         self.annotations = as_sorted_error_check(self.annotations)
         self.links = as_sorted_error_check(self.links)
@@ -433,6 +439,7 @@ class DataPack(BasePack[Entry, Link, Group]):
             self.__processed_original_spans,
             self.__orig_text_len,
         ) = data_utils_io.modify_text_and_track_ops(text, span_ops)
+        self.__replace_back_ops = None
 
     def set_audio(self, audio: np.ndarray, sample_rate: int):
         r"""Set the audio payload and sample rate of the :class:`DataPack`
@@ -514,6 +521,14 @@ class DataPack(BasePack[Entry, Link, Group]):
         req_begin = input_processed_span.begin
         req_end = input_processed_span.end
 
+        # The spans of the replace back operations are the processed spans
+        # in `__processed_original_spans`, in the same order.
+        if self.__replace_back_ops is None:
+            self.__replace_back_ops = ReplaceOps.from_list(
+                self.__replace_back_operations
+            )
+        replace_back_ops = self.__replace_back_ops
+
         def get_original_index(
             input_index: int, is_begin_index: bool, mode: str
         ) -> int:
@@ -531,19 +546,22 @@ class DataPack(BasePack[Entry, Link, Group]):
 
             len_processed_text = len(self._text)
             orig_index = None
-            prev_end = 0
-            for (
-                inverse_span,
-                original_span,
-            ) in self.__processed_original_spans:
+            # The processed spans are sorted and mutually exclusive, so the
+            # first one ending after input_index either contains it or is
+            # right after the unprocessed span that contains it.
+            position = replace_back_ops.locate(input_index)
+            if 0 <= input_index and position < len(replace_back_ops):
+                inverse_span, original_span = self.__processed_original_spans[
+                    position
+                ]
                 # check if the input_index lies between one of the unprocessed
                 # spans
-                if prev_end <= input_index < inverse_span.begin:
+                if input_index < inverse_span.begin:
                     increment = original_span.begin - inverse_span.begin
                     orig_index = input_index + increment
                 # check if the input_index lies between one of the processed
                 # spans
-                elif inverse_span.begin <= input_index < inverse_span.end:
+                else:
                     # look backward - backward shift of input_index
                     if is_begin_index and mode in ["backward", "relaxed"]:
                         orig_index = original_span.begin
@@ -556,11 +574,6 @@ class DataPack(BasePack[Entry, Link, Group]):
                     if not is_begin_index and mode in ["forward", "relaxed"]:
                         orig_index = original_span.end - 1
 
-                # break if the original index is populated
-                if orig_index is not None:
-                    break
-                prev_end = inverse_span.end
-
             if orig_index is None:
                 # check if the input_index lies between the last unprocessed
                 # span
@@ -893,7 +906,8 @@ class DataPack(BasePack[Entry, Link, Group]):
             valid_component_id: Set[int] = set()
             for component in context_components:
                 valid_component_id |= self.get_ids_by_creator(component)
-            valid_context_ids &= valid_component_id
+            # Do not update in place, the set is cached by the index.
+            valid_context_ids = valid_context_ids & valid_component_id
 
         def get_annotation_list(
             c_type: Union[Type[Annotation], Type[AudioAnnotation]]
@@ -12,9 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Iterator, Tuple, Optional, Any
+from dataclasses import dataclass, field
+from typing import Dict, List, Iterator, Tuple, Optional, Any, Sequence
+import sys
 import uuid
 
+import numpy as np
+
 from forte.utils import get_class
 from forte.data.base_store import BaseStore
 from forte.data.entry_type_generator import EntryTypeGenerator
@@ -22,6 +26,231 @@ from forte.data.entry_type_generator import EntryTypeGenerator
 __all__ = ["DataStore"]
 
 
+# When at most this many rows are appended after the last sort, they are
+# merged into the existing order by binary search instead of sorting again.
+_MAX_MERGE_ROWS = 64
+
+
+@dataclass
+class AttrSchema:
+    r"""The attributes of one entry type, resolved once when the type is
+    registered in a :class:`DataStore`. Attribute names are interned, so the
+    name to id lookup on every `set_attribute()` and `get_attribute()` call
+    is a single dict hit.
+
+    Args:
+        name_to_id (dict): A mapping from attribute name to `attr_id`.
+        id_to_name (dict): A mapping from `attr_id` to attribute name.
+        slots (dict): A mapping from `attr_id` to the column of the
+            attribute in the attribute slab of :class:`TypeColumns`, the
+            slots follow the order of `attr_id`.
+    """
+    name_to_id: Dict[str, int]
+    id_to_name: Dict[int, str]
+    slots: Dict[int, int]
+
+    @classmethod
+    def from_attributes(cls, attributes: Dict[str, int]) -> "AttrSchema":
+        r"""Create the schema from an attribute dictionary of
+        `DataStore._type_attributes`.
+        """
+        name_to_id = {
+            sys.intern(name): attr_id for name, attr_id in attributes.items()
+        }
+        return cls(
+            name_to_id=name_to_id,
+            id_to_name={attr_id: name for name, attr_id in name_to_id.items()},
+            slots={
+                attr_id: slot
+                for slot, attr_id in enumerate(sorted(name_to_id.values()))
+            },
+        )
+
+
+@dataclass
+class TypeColumns:
+    r"""The column storage of all the annotation entries of one type.
+
+    Instead of keeping one python list per entry, every field of the entries
+    is stored in its own array, so that scanning a single field (e.g.,
+    `begin`) only touches a contiguous block of memory. The attributes share
+    one 2-d object slab with a column per attribute, so adding an entry
+    allocates no python object besides its `tid`. Row `i` of every column
+    belongs to the `i`-th inserted entry of this type. The arrays are
+    pre-allocated and their capacity is doubled on overflow, only the first
+    `size` rows are valid.
+
+    Rows are kept in insertion order, the order sorted by (`begin`, `end`) is
+    stored as a permutation of the rows in `order`. New rows are only
+    appended, `order` covers the first `len(order)` rows and the remaining
+    rows are sorted into it lazily on the next read.
+
+    Args:
+        type_name (str): The fully qualified name of the type.
+        schema (AttrSchema): The attributes of the type.
+        begin (np.ndarray): The int64 column of begin indices.
+        end (np.ndarray): The int64 column of end indices.
+        tid (np.ndarray): The column of `tid`. Since a `tid` is a 128-bit
+            uuid, it does not fit in int64 and is stored as objects.
+        attrs (np.ndarray): The 2-d object slab of the attributes, the
+            column of an attribute is given by `schema.slots`.
+        size (int): The number of valid rows.
+        order (np.ndarray): The rows sorted by (`begin`, `end`).
+        rank (np.ndarray, optional): The inverse permutation of `order`,
+            None if it needs to be recomputed.
+    """
+    type_name: str
+    schema: AttrSchema
+    begin: np.ndarray
+    end: np.ndarray
+    tid: np.ndarray
+    attrs: np.ndarray
+    size: int = 0
+    order: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.int64)
+    )
+    rank: Optional[np.ndarray] = None
+
+    @classmethod
+    def allocate(
+        cls, type_name: str, schema: AttrSchema, capacity: int = 16
+    ) -> "TypeColumns":
+        r"""Create empty columns of `type_name` with room for `capacity`
+        entries. Every attribute column is initialized with None.
+        """
+        return cls(
+            type_name=type_name,
+            schema=schema,
+            begin=np.empty(capacity, dtype=np.int64),
+            end=np.empty(capacity, dtype=np.int64),
+            tid=np.empty(capacity, dtype=object),
+            attrs=np.empty((capacity, len(schema.slots)), dtype=object),
+        )
+
+    def _reserve(self, num_rows: int):
+        r"""Make sure there is room for `num_rows` more rows."""
+        capacity = len(self.begin) or 16
+        while capacity < self.size + num_rows:
+            capacity *= 2
+        if capacity == len(self.begin):
+            return
+
+        def _resized(column: np.ndarray) -> np.ndarray:
+            new_column = np.empty(
+                (capacity,) + column.shape[1:], dtype=column.dtype
+            )
+            new_column[: self.size] = column[: self.size]
+            return new_column
+
+        self.begin = _resized(self.begin)
+        self.end = _resized(self.end)
+        self.tid = _resized(self.tid)
+        self.attrs = _resized(self.attrs)
+
+    def append(self, begin: int, end: int, tid: int) -> int:
+        r"""Append a new entry to the end of the columns and return its row.
+        All the attributes of the entry are None.
+        """
+        self._reserve(1)
+        row = self.size
+        self.begin[row] = begin
+        self.end[row] = end
+        self.tid[row] = tid
+        self.size += 1
+        return row
+
+    def extend(
+        self, begins: np.ndarray, ends: np.ndarray, tids: np.ndarray
+    ) -> np.ndarray:
+        r"""Append a batch of new entries to the end of the columns and
+        return their rows. All the attributes of the entries are None.
+        """
+        num_rows = len(begins)
+        self._reserve(num_rows)
+        rows = np.arange(self.size, self.size + num_rows)
+        self.begin[rows] = begins
+        self.end[rows] = ends
+        self.tid[rows] = tids
+        self.size += num_rows
+        return rows
+
+    def sorted_rows(self) -> np.ndarray:
+        r"""Return the valid rows sorted by (`begin`, `end`). Entries with
+        the same span stay in their insertion order.
+        """
+        num_sorted = len(self.order)
+        if num_sorted == self.size:
+            return self.order
+
+        if self.size - num_sorted > _MAX_MERGE_ROWS:
+            self.order = np.lexsort(
+                (self.end[: self.size], self.begin[: self.size])
+            )
+        else:
+            # Sort the few pending rows, then find their insert positions in
+            # the sorted order. Inserting after the equal spans keeps the
+            # insertion order of ties, same as the stable `lexsort`.
+            pending = np.arange(num_sorted, self.size)
+            pending = pending[
+                np.lexsort((self.end[pending], self.begin[pending]))
+            ]
+            sorted_begin = self.begin[self.order]
+            sorted_end = self.end[self.order]
+            lower = np.searchsorted(
+                sorted_begin, self.begin[pending], side="left"
+            )
+            upper = np.searchsorted(
+                sorted_begin, self.begin[pending], side="right"
+            )
+            positions = [
+                lo + np.searchsorted(sorted_end[lo:hi], self.end[row], "right")
+                for lo, hi, row in zip(lower, upper, pending)
+            ]
+            self.order = np.insert(self.order, positions, pending)
+        self.rank = None
+        return self.order
+
+    def position(self, row: int) -> int:
+        r"""Return the position of `row` in the sorted order."""
+        order = self.sorted_rows()
+        if self.rank is None:
+            self.rank = np.empty_like(order)
+            self.rank[order] = np.arange(len(order))
+        return int(self.rank[row])
+
+    def row_data(self, row: int) -> List:
+        r"""Assemble the `entry data` of `row` in the list format of
+        [<begin>, <end>, <tid>, <type_name>, <attr_1>, ..., <attr_n>].
+        """
+        entry: List[Any] = [
+            int(self.begin[row]),
+            int(self.end[row]),
+            self.tid[row],
+            self.type_name,
+        ]
+        entry += self.attrs[row].tolist()
+        return entry
+
+    def get_attr(self, row: int, attr_id: int) -> Any:
+        r"""Return the value of attribute `attr_id` of `row`."""
+        return self.attrs[row, self.schema.slots[attr_id]]
+
+    def set_attr(self, row: int, attr_id: int, attr_value: Any):
+        r"""Set the value of attribute `attr_id` of `row`."""
+        self.attrs[row, self.schema.slots[attr_id]] = attr_value
+
+    def attr_block(self, attr_ids: Sequence[int]) -> np.ndarray:
+        r"""Return the values of the attributes `attr_ids` of all the valid
+        rows as a 2-d object array, with a row per entry in the sorted order
+        and a column per attribute in the order of `attr_ids`.
+        """
+        slots = np.asarray(
+            [self.schema.slots[attr_id] for attr_id in attr_ids],
+            dtype=np.intp,
+        )
+        return self.attrs[np.ix_(self.sorted_rows(), slots)]
+
+
 class DataStore(BaseStore):
     # TODO: temporarily disable this for development purposes.
     # pylint: disable=pointless-string-statement
@@ -41,26 +270,28 @@ class DataStore(BaseStore):
          (e.g. bounding boxes).
 
         Internally, we store every entry in a variable `__elements`, which is
-        a nested list: a list of `entry lists`.
+        a list of `entry columns`.
 
-        Every inner list, the `entry list`, is a list storing entries for a
+        Every `entry columns` (see :class:`TypeColumns`) stores entries for a
         single particular type, such as entries for
         `ft.onto.base_ontology.Sentence`. Different types are stored in
-        different lists: [ <Document List>, <Sentence List>, ...]. We will
-        discuss the sorting order later.
+        different columns: [ <Document columns>, <Sentence columns>, ...].
+        We will discuss the sorting order later.
 
-        The outer list, stores a list of `entry lists`, and each `entry list`
+        The outer list, stores a list of `entry columns`, and each of them
         is indexed by the type of its element. Specifically, each type is
         associated with a unique `type_id`, which is generated by the system.
         The mapping between `type_name` and `type_id` is defined by a dictionary
         `self.__type_index_dict`.
 
-        Entry information is stored as `entry data` in each `entry list`.
-        Each element in the `entry list` (an entry data) corresponds to one
-        entry instance.
+        Entry information is stored column-wise: instead of one list per
+        entry, each field of a type has its own array, and an entry instance
+        corresponds to one row across these arrays. This layout keeps
+        scans over a single field (e.g. the `begin` of all the
+        annotations) cache friendly.
 
-        Each `entry data` in the `entry list` is represented by a list of
-        attributes.
+        The `entry data` of an entry is obtained by gathering its row from
+        the columns into a list of attributes.
         For example, an annotation type entry has the following format:
         [<begin>, <end>, <tid>, <type_name>, <attr_1>, <attr_2>, ...,
         <attr_n>].
@@ -87,7 +318,7 @@ class DataStore(BaseStore):
         `entry data` list.
 
         Here, `type_name` is the fully qualifie name of this type represented
-        by `entry list`. It must be a valid ontology defined as a class.
+        by `entry columns`. It must be a valid ontology defined as a class.
         `tid` is a unique id of every entry, which is internally generated by
         uuid.uuid4().
         Each `type_name` corresponds to a pre-defined ordered list of
@@ -98,16 +329,18 @@ class DataStore(BaseStore):
         [<begin>, <end>, <tid>, <type_name>, <document_class>, <sentiment>,
         <classifications>].
         Here, <document_class>, <sentiment>, <classifications> are the 3
-        attributes of this type. This allows the `entry list` behaves like a
+        attributes of this type. This allows the `entry columns` behaves like a
         table, we can find the value of an attribute through the correct
-        `index_id` id (e.g. index of the outer list) and `attr_id`
-        (e.g. index of the inner list).
+        row (e.g. the position of the entry in the columns) and `attr_id`
+        (e.g. the column of the attribute in the slab).
 
-        Note that, if the type of `entry list` is Annotation-Like (e.g.
+        Note that, if the type of `entry columns` is Annotation-Like (e.g.
         subclasses of Annotation or AudioAnnotation), these entries will be
-        sorted by the first two attributes (`begin`, `end`). However, the
-        order of a list with types that are not Annotation-like, is currently
-        based on the insertion order.
+        iterated in the order sorted by the first two attributes (`begin`,
+        `end`). The rows themselves are kept in insertion order, the sorted
+        order is a permutation of the rows which is maintained lazily.
+        However, the order of a list with types that are not Annotation-like,
+        is currently based on the insertion order.
 
         `onto_file_path` is an optional argument, which allows one to pass in
         a user defined ontology file. This will enable the DataStore to
@@ -118,13 +351,12 @@ class DataStore(BaseStore):
         """
         super().__init__()
         self.onto_file_path = onto_file_path
-        self.__entry_type_idx = 3
 
         """
         The `_type_attributes` is a private dictionary that provides
         `type_name` and the order of corresponding attributes except `index_id`.
-        The outer keys are indices of `entry lists` in `self.__elements` as
-        ints, representing all types that inherit the `Entry` class.
+        The outer keys are fully qualified names of the types, representing
+        all types that inherit the `Entry` class.
         The inner keys are all the valid attributes for this type.
         The values are the indices of attributes among these lists.
 
@@ -158,15 +390,12 @@ class DataStore(BaseStore):
         The `__type_index_dict` is a private dictionary that has reverse
         structure of `self.__type_dict`. It is only used for generators to map
         'type_name' to `type_id.
-        It should be created only once no matter how many data store objects
-        are initialized.
+        A type is registered the first time an entry of this type is added.
 
         Example:
 
         .. code-block:: python
 
-            self.__type_index_dict: dict = get_type_index_dict()
-
             # self.__type_index_dict is:
             # {
             #     "ft.onto.base_ontology.Token": 0,
@@ -174,59 +403,62 @@ class DataStore(BaseStore):
             #     "ft.onto.base_ontology.Sentence": 2,
             # }
         """
-        # TODO: implement get_type_id_rev() (Issue #need creation)
-        self.__type_index_dict: dict = {}
+        self.__type_index_dict: Dict[str, int] = {}
 
         """
         The `__elements` is an underlying storage structure for all the entry
         data added by users in this DataStore class.
-        It is a list of lists that stores sorted `entry lists` by the order of
-        `type_id`.
+        It is a list of `TypeColumns` ordered by `type_id`.
 
             Example:
             self.__elements = [
-                Token SortedList(),
-                Document SortedList(),
-                Sentence SortedList(),
+                Token TypeColumns,
+                Document TypeColumns,
+                Sentence TypeColumns,
                 ...
             ]
         """
-        self.__elements: List = []
+        self.__elements: List[TypeColumns] = []
 
         """
         A dictionary that keeps record of all entrys with their tid.
-        It is a key-value map of {tid: entry data in list format}.
+        It is a key-value map of {tid: (type_id, row)}, where `row` is the
+        location of the entry in the columns of `type_id`.
 
-        e.g., {1423543453: [begin, end, tid, type_name, attr_1, ..., attr_n],
-        4345314235: [parent_tid, child_tid, tid, type_name, attr_1, ...,
-                    attr_n, index_id]}
+        e.g., {1423543453: (0, 5), 4345314235: (2, 0)}
         """
-        self.__entry_dict: dict = {}
+        self.__entry_dict: Dict[int, Tuple[int, int]] = {}
 
     def _new_tid(self) -> int:
         r"""This function generates a new `tid` for an entry."""
         return uuid.uuid4().int
 
-    def _new_annotation(self, type_name: str, begin: int, end: int) -> List:
-        r"""This function generates a new annotation with default fields. All
-        default fields are filled with None.
-        Called by add_annotation_raw() to create a new annotation with
-        `type_name`, `begin`, and `end`.
+    def _get_type_id(self, type_name: str) -> int:
+        r"""This function returns the `type_id` of `type_name`. If the type
+        is not registered yet, its attribute schema is resolved from
+        `self._type_attributes` and empty columns are allocated for it in
+        `self.__elements`.
 
         Args:
-            type_name (str): The fully qualified type name of the new entry.
-            begin (int): Begin index of the entry.
-            end (int): End index of the entry.
+            type_name (str): The fully qualified type name of the entry.
 
         Returns:
-            A list representing a new annotation type entry data.
+            The `type_id` of `type_name`.
         """
-
-        tid: int = self._new_tid()
-        entry: List[Any]
-        entry = [begin, end, tid, type_name]
-        entry += len(self._type_attributes[type_name]) * [None]
-        return entry
+        try:
+            return self.__type_index_dict[type_name]
+        except KeyError:
+            type_id = len(self.__elements)
+            self.__elements.append(
+                TypeColumns.allocate(
+                    type_name,
+                    AttrSchema.from_attributes(
+                        self._type_attributes[type_name]
+                    ),
+                )
+            )
+            self.__type_index_dict[type_name] = type_id
+            return type_id
 
     def _new_link(
         self, type_name: str, parent_tid: int, child_tid: int
@@ -272,7 +504,7 @@ class DataStore(BaseStore):
 
     def add_annotation_raw(self, type_name: str, begin: int, end: int) -> int:
         r"""This function adds an annotation entry with `begin` and `end`
-        indices to the sortedlist of `type_name` in `self.__elements`,
+        indices to the columns of `type_name` in `self.__elements`,
         returns the `tid` for the inserted entry.
 
         Args:
@@ -282,13 +514,49 @@ class DataStore(BaseStore):
         Returns:
             `tid` of the entry.
         """
-        # We should create the `entry data` with the format
-        # [begin, end, tid, type_id, None, ...].
-        # A helper function _new_annotation() can be used to generate a
-        # annotation type entry data with default fields.
-        # A reference to the entry should be store in both self.__elements and
-        # self.__entry_dict.
-        raise NotImplementedError
+        # The entry is appended as a new row of its type columns, all its
+        # attributes are None. It is sorted into the order of the columns
+        # on the next read.
+        type_id = self._get_type_id(type_name)
+        tid: int = self._new_tid()
+        row = self.__elements[type_id].append(begin, end, tid)
+        self.__entry_dict[tid] = (type_id, row)
+        return tid
+
+    def add_annotations_raw(
+        self, type_name: str, begins: np.ndarray, ends: np.ndarray
+    ) -> np.ndarray:
+        r"""This function adds a batch of annotation entries with `begins`
+        and `ends` indices to the columns of `type_name` in `self.__elements`,
+        returns the `tid` of the inserted entries.
+
+        The entries are appended in one go and the columns are sorted once
+        on the next read, which is much faster than adding them one by one
+        with `add_annotation_raw()` (e.g., when adding all the tokens of a
+        document).
+
+        Args:
+            type_name (str): The fully qualified type name of the new
+                Annotations.
+            begins (np.ndarray): Begin indices of the entries.
+            ends (np.ndarray): End indices of the entries, must have the same
+                length as `begins`.
+        Returns:
+            An object array of the `tid` of the new entries, in the same
+            order as `begins`.
+        """
+        if len(begins) != len(ends):
+            raise ValueError(
+                f"Got {len(begins)} begin indices but {len(ends)} end indices."
+            )
+        type_id = self._get_type_id(type_name)
+        tids = np.empty(len(begins), dtype=object)
+        tids[:] = [self._new_tid() for _ in range(len(begins))]
+        rows = self.__elements[type_id].extend(begins, ends, tids)
+        self.__entry_dict.update(
+            zip(tids, ((type_id, row) for row in rows.tolist()))
+        )
+        return tids
 
     def add_link_raw(
         self, type_name: str, parent_tid: int, child_tid: int
@@ -327,6 +595,30 @@ class DataStore(BaseStore):
         """
         raise NotImplementedError
 
+    def _get_attr_id(self, tid: int, attr_name: str) -> int:
+        r"""This function finds the `attr_id` of `attr_name` in the schema of
+        the type of the entry with `tid`. Called by `set_attribute()` and
+        `get_attribute()`.
+
+        Args:
+            tid (int): Unique id of the entry.
+            attr_name (str): Name of the attribute.
+
+        Returns:
+            The `attr_id` of `attr_name`.
+        """
+        try:
+            type_id, _ = self.__entry_dict[tid]
+        except KeyError:
+            raise KeyError(f"Entry with tid {tid} not found.") from None
+        columns = self.__elements[type_id]
+        try:
+            return columns.schema.name_to_id[attr_name]
+        except KeyError:
+            raise ValueError(
+                f"{columns.type_name} has no {attr_name} attribute."
+            ) from None
+
     def set_attribute(self, tid: int, attr_name: str, attr_value: Any):
         r"""This function locates the entry data with `tid` and sets its
         `attr_name` with `attr_value`. It first finds `attr_id` according
@@ -338,13 +630,7 @@ class DataStore(BaseStore):
             attr_name (str): Name of the attribute.
             attr_value (any): Value of the attribute.
         """
-        if tid not in self.__entry_dict:
-            raise KeyError(f"Entry with tid {tid} not found.")
-        entry_type = self.__entry_dict[tid][self.__entry_type_idx]
-        if attr_name not in self._type_attributes[entry_type]:
-            raise ValueError(f"{entry_type} has no {attr_name} attribute.")
-        attr_id = self._type_attributes[entry_type][attr_name]
-        self.set_attr(tid, attr_id, attr_value)
+        self.set_attr(tid, self._get_attr_id(tid, attr_name), attr_value)
 
     def set_attr(self, tid: int, attr_id: int, attr_value: Any):
         r"""This function locates the entry data with `tid` and sets its
@@ -356,10 +642,10 @@ class DataStore(BaseStore):
             attr_id (int): The id of the attribute.
             attr_value (any): The value of the attribute.
         """
-        # We retrieve the entry data from `__entry_dict` using tid.
-        # We locate the attribute using `attr_id` and update the attribute.
-        entry = self.__entry_dict[tid]
-        entry[attr_id] = attr_value
+        # We retrieve the location of the entry from `__entry_dict` using tid.
+        # We locate the attribute column using `attr_id` and update the row.
+        type_id, row = self.__entry_dict[tid]
+        self.__elements[type_id].set_attr(row, attr_id, attr_value)
 
     def get_attribute(self, tid: int, attr_name: str) -> Any:
         r"""This function finds the value of `attr_name` in entry with
@@ -374,13 +660,7 @@ class DataStore(BaseStore):
         Returns:
             The value of `attr_name` for the entry with `tid`.
         """
-        if tid not in self.__entry_dict:
-            raise KeyError(f"Entry with tid {tid} not found.")
-        entry_type = self.__entry_dict[tid][self.__entry_type_idx]
-        if attr_name not in self._type_attributes[entry_type]:
-            raise ValueError(f"{entry_type} has no {attr_name} attribute.")
-        attr_id = self._type_attributes[entry_type][attr_name]
-        return self.get_attr(tid, attr_id)
+        return self.get_attr(tid, self._get_attr_id(tid, attr_name))
 
     def get_attr(self, tid: int, attr_id: int) -> Any:
         r"""This function locates the entry data with `tid` and gets the value
@@ -393,10 +673,10 @@ class DataStore(BaseStore):
         Returns:
             The value of `attr_id` for the entry with `tid`.
         """
-        # We retrieve the entry data from `__entry_dict` using tid.
-        # We locate the attribute using `attr_id` and get the attribute.
-        entry = self.__entry_dict[tid]
-        return entry[attr_id]
+        # We retrieve the location of the entry from `__entry_dict` using tid.
+        # We locate the attribute column using `attr_id` and read the row.
+        type_id, row = self.__entry_dict[tid]
+        return self.__elements[type_id].get_attr(row, attr_id)
 
     def delete_entry(self, tid: int):
         r"""This function locates the entry data with `tid` and removes it
@@ -433,10 +713,12 @@ class DataStore(BaseStore):
             The entry which `tid` corresponds to, its `type_id` and its index
             in the `type_name` list.
         """
-        # If the entry is an annotation, bisect the annotation sortedlist
-        # to find the entry. May use LRU cache to optimize speed.
-        # Otherwise, use `index_id` to find the index of the entry.
-        raise NotImplementedError
+        # The location of the entry is recorded in `__entry_dict`, so no
+        # search in the sorted order is needed.
+        if tid not in self.__entry_dict:
+            raise KeyError(f"Entry with tid {tid} not found.")
+        type_id, row = self.__entry_dict[tid]
+        return self.__elements[type_id].row_data(row), type_id, row
 
     def get(
         self, type_name: str, include_sub_type: bool = True
@@ -452,27 +734,72 @@ class DataStore(BaseStore):
             An iterator of the entries matching the provided arguments.
         """
         # We use the `type_id` to find its `entry_type` and all subclasses.
-        # We locate the lists.
-        # We create an iterator to generate entries from the list.
+        # We locate the columns.
+        # We create an iterator to generate entries in the sorted order.
+        for type_id in self._get_type_ids(type_name, include_sub_type):
+            yield from self._iter_columns(type_id)
+
+    def get_attrs(
+        self,
+        type_name: str,
+        attr_ids: Sequence[int],
+        include_sub_type: bool = False,
+    ) -> np.ndarray:
+        r"""This function fetches the values of the attributes `attr_ids`
+        of all the entries of type `type_name` at once. Compared to calling
+        `get_attr()` for every entry and attribute, the values are read
+        from the attribute slab of each type in a single pass.
+
+        Args:
+            type_name (str): The fully qualified name of the entry.
+            attr_ids (list): The ids of the attributes in `type_name`.
+            include_sub_type: A boolean to indicate whether get its subclass.
+                The same attributes are read from the subclasses, even if
+                their ids are different in the subclasses.
+
+        Returns:
+            A 2-d object array with a row per entry, in the order of `get()`,
+            and a column per attribute in the order of `attr_ids`.
+        """
+        schema = self.__elements[self.__type_index_dict[type_name]].schema
+        attr_names = [schema.id_to_name[attr_id] for attr_id in attr_ids]
+        blocks = []
+        for type_id in self._get_type_ids(type_name, include_sub_type):
+            columns = self.__elements[type_id]
+            blocks.append(
+                columns.attr_block(
+                    [columns.schema.name_to_id[name] for name in attr_names]
+                )
+            )
+        return blocks[0] if len(blocks) == 1 else np.concatenate(blocks)
+
+    def _get_type_ids(
+        self, type_name: str, include_sub_type: bool
+    ) -> List[int]:
+        r"""Return the `type_id` of `type_name`, and of all its registered
+        subclasses if `include_sub_type` is True. Called by `get()` and
+        `get_attrs()`.
+        """
         type_id = self.__type_index_dict[type_name]
-        if include_sub_type:
-            entry_class = get_class(type_name)
-            all_types = []
-            # iterate all classes to find subclasses
-            for types in self.__type_index_dict.items():
-                if issubclass(get_class(types[0]), entry_class):
-                    all_types.append(types[1])
-            for id in all_types:
-                for entry in self.__elements[id]:
-                    yield entry
-        else:
-            for entry in self.__elements[type_id]:
-                yield entry
+        if not include_sub_type:
+            return [type_id]
+        entry_class = get_class(type_name)
+        # iterate all classes to find subclasses
+        return [
+            sub_type_id
+            for sub_type_name, sub_type_id in self.__type_index_dict.items()
+            if issubclass(get_class(sub_type_name), entry_class)
+        ]
+
+    def _iter_columns(self, type_id: int) -> Iterator[List]:
+        columns = self.__elements[type_id]
+        for row in columns.sorted_rows():
+            yield columns.row_data(row)
 
     def next_entry(self, tid: int) -> List:
         r"""Get the next entry of the same type as the `tid` entry.
-        Call `get_entry()` to find the current index and use it to find
-        the next entry.
+        The position of the entry in the sorted order of its type is used
+        to find the next entry.
 
         Args:
             tid (int): Unique id of the entry.
@@ -480,12 +807,12 @@ class DataStore(BaseStore):
         Returns:
             The next entry of the same type as the `tid` entry.
         """
-        raise NotImplementedError
+        return self._neighbor_entry(tid, 1)
 
     def prev_entry(self, tid: int) -> List:
         r"""Get the previous entry of the same type as the `tid` entry.
-        Call `get_entry()` to find the current index and use it to find
-        the previous entry.
+        The position of the entry in the sorted order of its type is used
+        to find the previous entry.
 
         Args:
             tid (int): Unique id of the entry.
@@ -493,4 +820,20 @@ class DataStore(BaseStore):
         Returns:
             The previous entry of the same type as the `tid` entry.
         """
-        raise NotImplementedError
+        return self._neighbor_entry(tid, -1)
+
+    def _neighbor_entry(self, tid: int, offset: int) -> List:
+        r"""Get the entry `offset` positions away from the `tid` entry in
+        the sorted order of its type. Called by `next_entry()` and
+        `prev_entry()`.
+        """
+        if tid not in self.__entry_dict:
+            raise KeyError(f"Entry with tid {tid} not found.")
+        type_id, row = self.__entry_dict[tid]
+        columns = self.__elements[type_id]
+        position = columns.position(row) + offset
+        if not 0 <= position < columns.size:
+            raise IndexError(
+                f"Entry with tid {tid} has no entry at offset {offset}."
+            )
+        return columns.row_data(columns.sorted_rows()[position])
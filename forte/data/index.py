@@ -23,8 +23,9 @@ from typing import (
     Hashable,
     Generic,
     Iterable,
-    Tuple,
+    ItemsView,
     KeysView,
+    Sequence,
 )
 
 from forte.common.exception import PackIndexError
@@ -36,6 +37,7 @@ __all__ = ["BaseIndex"]
 
 
 class BaseIndex(Generic[EntryType]):
+    # pylint: disable=too-many-public-methods
     r"""A set of indexes used in :class:`BasePack`:
 
     #. :attr:`entry_index`, the index from each tid to the corresponding entry
@@ -66,6 +68,11 @@ class BaseIndex(Generic[EntryType]):
         # query_by_type_subtype is called.
         self._subtype_index: Dict[Type[EntryType], Set[int]] = {}
 
+        # Mapping from a type to all the indexed types that are sub-types of
+        # it (including itself). It is extended once per newly indexed type,
+        # so that sub-types can be found without scanning all the types.
+        self._subclass_closure: Dict[Type, List[Type[EntryType]]] = {}
+
         self._group_index: DefaultDict[Hashable, Set[int]] = defaultdict(set)
         self._link_index: Dict[str, DefaultDict[Hashable, Set[int]]] = {}
 
@@ -88,12 +95,39 @@ class BaseIndex(Generic[EntryType]):
         Args:
             entries (list): a list of entries to be added into the basic index.
         """
+        # Bind the indexes and the per entry values to locals, this loop runs
+        # once for every entry added to the pack.
+        entry_index = self._entry_index
+        type_index = self._type_index
+        new_types: Set[Type[EntryType]] = set()
         for entry in entries:
-            self._entry_index[entry.tid] = entry
-            self._type_index[type(entry)].add(entry.tid)
-            # Disable sub type index since new items are added and this will
-            #  be rebuilt in next query (`query_by_type_subtype`).
-            self._subtype_index.pop(type(entry), None)
+            tid = entry.tid
+            entry_type = type(entry)
+            entry_index[tid] = entry
+            type_index[entry_type].add(tid)
+            new_types.add(entry_type)
+        for entry_type in new_types:
+            if entry_type not in self._subclass_closure.get(entry_type, ()):
+                self._add_to_subclass_closure(entry_type)
+        # Disable sub type index of the new types and all their super types
+        #  since new items are added and this will be rebuilt in next query
+        #  (`query_by_type_subtype`).
+        self._invalidate_subtype_index(new_types)
+
+    def _add_to_subclass_closure(self, entry_type: Type[EntryType]):
+        r"""Register a newly indexed ``entry_type`` as a sub-type of each of
+        its super types (and itself) in :attr:`_subclass_closure`.
+        """
+        for super_type in entry_type.__mro__[:-1]:
+            self._subclass_closure.setdefault(super_type, []).append(entry_type)
+
+    def _invalidate_subtype_index(self, entry_types: Iterable[Type[EntryType]]):
+        r"""Remove the cached sub-type index of every type that is a super type
+        of (or the same as) one of the ``entry_types``.
+        """
+        for entry_type in entry_types:
+            for super_type in entry_type.__mro__:
+                self._subtype_index.pop(super_type, None)
 
     def get_entry(self, tid: int) -> EntryType:
         return self._entry_index[tid]
@@ -104,14 +138,27 @@ class BaseIndex(Generic[EntryType]):
     def query_by_type(self, t: Type[EntryType]) -> Set[int]:
         return self._type_index[t]
 
+    def query_sub_types(self, t: Type) -> Sequence[Type[EntryType]]:
+        r"""Look up the indexed types that are ``t`` or sub-types of ``t``.
+
+        Args:
+            t: The type to look up the sub-types for.
+
+        Returns:
+            The indexed types extending ``t``, including ``t`` itself if
+            entries of ``t`` have been indexed.
+        """
+        return self._subclass_closure.get(t, ())
+
     def query_by_type_subtype(self, t: Type[EntryType]) -> Set[int]:
         r"""Look up the entry indices that are instances of ``entry_type``,
         including children classes of ``entry_type``.
 
-        Note: all the known types to this data pack will be scanned to find
-          all sub-types. This method will try to cache the sub-type information
-          after the first call, but the cached information could be invalidated
-          by other operations (such as adding new items to the data pack).
+        Note: the sub-types are looked up from the sub-type closure that is
+          maintained when new types are indexed. This method will try to cache
+          the result after the first call, but the cached information could be
+          invalidated by other operations (such as adding new items to the
+          data pack).
 
         Args:
             t: The type of the entry you are looking for.
@@ -123,20 +170,26 @@ class BaseIndex(Generic[EntryType]):
         if t in self._subtype_index:
             return self._subtype_index[t]
         else:
-            subclass_index: Set[int] = set()
-            for index_key, index_val in self.iter_type_index():
-                if issubclass(index_key, t):
-                    subclass_index.update(index_val)
+            # Union all the matching sets in a single call instead of
+            # updating the result once per type.
+            subclass_index: Set[int] = set().union(
+                *(
+                    self._type_index[sub_type]
+                    for sub_type in self._subclass_closure.get(t, ())
+                )
+            )
             self._subtype_index[t] = subclass_index
             return subclass_index
 
-    def iter_type_index(self) -> Iterable[Tuple[Type, Set[int]]]:
-        for t, ids in self._type_index.items():
-            yield t, ids
+    def iter_type_index(self) -> ItemsView[Type, Set[int]]:
+        # A view of the index itself, iterating it does not go through a
+        # python generator frame for every type.
+        return self._type_index.items()
 
     def remove_entry(self, entry: EntryType):
         self._entry_index.pop(entry.tid)
         self._type_index[type(entry)].remove(entry.tid)
+        self._invalidate_subtype_index([type(entry)])
 
         self.turn_group_index_switch(on=False)
         self.turn_link_index_switch(on=False)
@@ -196,10 +249,12 @@ class BaseIndex(Generic[EntryType]):
         if not self._link_index_switch:
             raise PackIndexError("Link index for pack not build")
 
+        # Use `get` so that looking up a node without links does not insert
+        # an empty set into the index.
         if as_parent:
-            return self._link_index["parent_index"][tid]
+            return self._link_index["parent_index"].get(tid, set())
         else:
-            return self._link_index["child_index"][tid]
+            return self._link_index["child_index"].get(tid, set())
 
     def group_index(self, tid: int) -> Set[int]:
         r"""Look up the group_index with key `tid`. If the index is not built,
@@ -207,7 +262,9 @@ class BaseIndex(Generic[EntryType]):
         """
         if not self.group_index_on:
             raise PackIndexError("Group index for pack not build")
-        return self._group_index[tid]
+        # Use `get` so that looking up an entry that is not a member of any
+        # group does not insert an empty set into the index.
+        return self._group_index.get(tid, set())
 
     def update_link_index(self, links: List[LinkType]):
         r"""Update :attr:`link_index` with the provided links, the index from
@@ -242,12 +299,13 @@ class BaseIndex(Generic[EntryType]):
         """
         logger.debug("Updating group index")
 
-        if not self._group_index:
+        if not self.group_index_on:
             raise PackIndexError("Group index has not been built.")
 
+        group_index = self._group_index
         for group in groups:
-            for member in group.members:  # type: ignore
-                self._group_index[member].add(group.tid)
+            for member in group.get_members():
+                group_index[member.index_key].add(group.tid)
 
     def add_link_parent(self, parent: EntryType, link: LinkType):
         self._link_index["parent_index"][parent.index_key].add(link.tid)
@@ -20,10 +20,64 @@ import numpy as np
 from forte.data.ontology.core import Entry
 from forte.data.span import Span
 
-__all__ = ["ReplaceOperationsType", "DataRequest", "MatrixLike"]
+__all__ = ["ReplaceOperationsType", "ReplaceOps", "DataRequest", "MatrixLike"]
 
 ReplaceOperationsType = List[Tuple[Span, str]]
 
+
+class ReplaceOps:
+    r"""The column form of :data:`ReplaceOperationsType`. The begins and ends
+    of the spans are stored in two int64 arrays and the replacement strings
+    in a list, so that the operation around an offset can be found by binary
+    search instead of a scan over the operations.
+
+    Args:
+        begins: The begin indices of the spans.
+        ends: The end indices of the spans.
+        strings: The replacement strings of the spans.
+    """
+
+    __slots__ = ("begins", "ends", "strings")
+
+    def __init__(
+        self, begins: np.ndarray, ends: np.ndarray, strings: List[str]
+    ):
+        self.begins = begins
+        self.ends = ends
+        self.strings = strings
+
+    @classmethod
+    def from_list(cls, ops: ReplaceOperationsType) -> "ReplaceOps":
+        r"""Create the columns from a list of spans and replacement strings."""
+        return cls(
+            np.fromiter(
+                (span.begin for span, _ in ops), dtype=np.int64, count=len(ops)
+            ),
+            np.fromiter(
+                (span.end for span, _ in ops), dtype=np.int64, count=len(ops)
+            ),
+            [replacement for _, replacement in ops],
+        )
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+    def locate(self, offset: int) -> int:
+        r"""Find the first operation whose span ends after `offset`. The spans
+        are expected to be sorted and mutually exclusive.
+
+        Args:
+            offset: The offset to look up.
+
+        Returns:
+            The index of the operation. `offset` lies in its span if the span
+            begins at or before `offset`, otherwise `offset` lies between
+            this span and the previous one. `len(self)` is returned if all
+            the spans end at or before `offset`.
+        """
+        return int(np.searchsorted(self.ends, offset, side="right"))
+
+
 DataRequest = Dict[Type[Entry], Union[Dict, List]]
 
-MatrixLike = Union[torch.TensorType, np.ndarray, List]
+MatrixLike = Union[torch.Tensor, np.ndarray, List]
@@ -25,8 +25,26 @@ NUM_CHAR_PAD = 2
 DIGIT_RE = re.compile(r"\d")
 
 
+class _DigitTranslationTable(dict):
+    r"""A translation table for :meth:`str.translate` that maps every decimal
+    digit to "0", which gives the same result as ``DIGIT_RE.sub("0", word)``
+    (``\d`` matches the unicode decimal digits). Entries are filled lazily
+    on the first lookup of each character.
+    """
+
+    def __missing__(self, ordinal: int) -> int:
+        value = ord("0") if chr(ordinal).isdecimal() else ordinal
+        self[ordinal] = value
+        return value
+
+
+_DIGIT_TABLE = _DigitTranslationTable()
+
+
 def normalize_digit_word(word):
-    return DIGIT_RE.sub("0", word)
+    # `str.translate` does a single linear scan, which is much faster than
+    # running the regular expression engine on every token.
+    return word.translate(_DIGIT_TABLE)
 
 
 def load_glove_embedding(embedding_path, normalize_digits=True):
@@ -59,7 +77,9 @@ def load_glove_embedding(embedding_path, normalize_digits=True):
             embedd = np.empty(embed_dim, dtype=np.float32)
             embedd[:] = tokens[1:]
             word = (
-                DIGIT_RE.sub("0", tokens[0]) if normalize_digits else tokens[0]
+                normalize_digit_word(tokens[0])
+                if normalize_digits
+                else tokens[0]
             )
             embedd_dict[word] = embedd
 
@@ -14,9 +14,11 @@
 
 import json
 import os
+import pickle
 from abc import ABC
 from typing import Counter as CounterType, Dict, List, Optional
 
+import numpy as np
 import texar.torch as tx
 
 from forte.processors.base import PackProcessor
@@ -51,6 +53,10 @@ class Alphabet:
 
         self.instance2index: Dict = {}
         self.instances: List = []
+        # A read-only array copy of `instances` for batch look-ups, built on
+        # the first `get_instances()` and dropped whenever `instances`
+        # changes. It is not pickled.
+        self._instances_frozen: Optional[np.ndarray] = None
 
         for sp in [
             self.reserved_tokens.PAD,
@@ -80,6 +86,7 @@ class Alphabet:
         if instance not in self.instance2index:
             self.instance2index[instance] = len(self.instance2index)
             self.instances.append(instance)
+            self._instances_frozen = None
 
     def get_index(self, instance):
         """
@@ -98,14 +105,11 @@ class Alphabet:
             if self.keep_growing:
                 self.add(instance)
                 return self.instance2index[instance]
-            else:
-                if self.ignore_case_in_query:
-                    try:
-                        return self.instance2index[instance.lower()]
-                    except KeyError:
-                        return self.instance2index[self.reserved_tokens.UNK]
-                else:
-                    return self.instance2index[self.reserved_tokens.UNK]
+            if self.ignore_case_in_query:
+                # A single look-up with a default, instead of catching a
+                # second `KeyError`.
+                return self.instance2index.get(instance.lower(), self.unk_id)
+            return self.unk_id
 
     def get_instance(self, index):
         try:
@@ -113,6 +117,30 @@ class Alphabet:
         except IndexError as e:
             raise IndexError("unknown index: %d" % index) from e
 
+    def get_instances(self, indices) -> np.ndarray:
+        """
+        Look up a batch of indices at once, this is much faster than calling
+        `get_instance` for every index (e.g., when decoding a batch of
+        predictions).
+
+        Args:
+            indices: An integer array (or a nested list) of indices.
+
+        Returns:
+            An object array of the same shape as `indices` containing the
+            instances of the indices.
+        """
+        if getattr(self, "_instances_frozen", None) is None:
+            self._freeze_instances()
+        return self._instances_frozen[  # type: ignore
+            np.asarray(indices, dtype=np.int64)
+        ]
+
+    def _freeze_instances(self):
+        frozen = np.empty(len(self.instances), dtype=object)
+        frozen[:] = self.instances
+        self._instances_frozen = frozen
+
     def size(self):
         return len(self.instances)
 
@@ -125,6 +153,16 @@ class Alphabet:
     def open(self):
         self.keep_growing = True
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_instances_frozen", None)
+        return state
+
+    def __setstate__(self, state):
+        # Alphabets pickled by older versions have no `_instances_frozen`.
+        self.__dict__.update(state)
+        self._instances_frozen = None
+
     def get_content(self):
         return {
             "instance2index": self.instance2index,
@@ -134,38 +172,94 @@ class Alphabet:
     def __from_json(self, data):
         self.instances = data["instances"]
         self.instance2index = data["instance2index"]
+        self._instances_frozen = None
 
-    def save(self, output_directory, name=None):
+    def save(
+        self,
+        output_directory,
+        name=None,
+        serialize_method: str = "json",
+    ):
         """
         Save both alphabet records to the given directory.
 
         Args:
             output_directory: Directory to save model and weights.
             name: The alphabet saving name, optional.
+            serialize_method: The method used to serialize the alphabet.
+                Currently supports "json" (the default, written to
+                `<name>.json`) and Python's built-in "pickle" (written to
+                `<name>.pkl`), which is much faster for large vocabularies.
         """
         saving_name = name if name else self.__name
 
         if not os.path.exists(output_directory):
             os.makedirs(output_directory)
 
-        with open(
-            os.path.join(output_directory, saving_name + ".json"),
-            "w",
-            encoding="utf-8",
-        ) as out:
-            json.dump(
-                self.get_content(),
-                out,
-                indent=4,
+        if serialize_method == "pickle":
+            # Only the instances are stored, `instance2index` is rebuilt
+            # from them on load.
+            with open(
+                os.path.join(output_directory, saving_name + ".pkl"), "wb"
+            ) as out:
+                pickle.dump(self.instances, out, pickle.HIGHEST_PROTOCOL)
+        elif serialize_method == "json":
+            with open(
+                os.path.join(output_directory, saving_name + ".json"),
+                "w",
+                encoding="utf-8",
+            ) as out:
+                json.dump(
+                    self.get_content(),
+                    out,
+                    indent=4,
+                )
+        else:
+            raise NotImplementedError(
+                f"Unsupported serialization method {serialize_method}"
             )
 
-    def load(self, input_directory, name=None):
+    def load(
+        self,
+        input_directory,
+        name=None,
+        serialize_method: str = "json",
+    ):
+        """
+        Load the alphabet records saved by `save`.
+
+        Args:
+            input_directory: Directory to load the alphabet from.
+            name: The alphabet loading name, optional.
+            serialize_method: The method used to serialize the alphabet,
+                either "json" or "pickle". It should be the same one used
+                in `save`.
+        """
         loading_name = name if name else self.__name
-        with open(
-            os.path.join(input_directory, loading_name + ".json"),
-            encoding="utf-8",
-        ) as f:
-            self.__from_json(json.load(f))
+        if serialize_method == "pickle":
+            with open(
+                os.path.join(input_directory, loading_name + ".pkl"), "rb"
+            ) as f:
+                instances = pickle.load(f)
+            self.__from_json(
+                {
+                    "instances": instances,
+                    "instance2index": {
+                        instance: index
+                        for index, instance in enumerate(instances)
+                    },
+                }
+            )
+        elif serialize_method == "json":
+            with open(
+                os.path.join(input_directory, loading_name + ".json"),
+                encoding="utf-8",
+            ) as f:
+                self.__from_json(json.load(f))
+        else:
+            raise NotImplementedError(
+                f"Unsupported serialization method {serialize_method}"
+            )
         self.keep_growing = False
 
 
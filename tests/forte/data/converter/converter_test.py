@@ -19,6 +19,7 @@ import torch
 
 from forte.data.converter import Converter
 from forte.data.converter import Feature
+from forte.data.converter import to_numpy, to_torch
 
 
 class ConverterTest(unittest.TestCase):
@@ -245,6 +246,20 @@ class ConverterTest(unittest.TestCase):
             )
         )
 
+    def test_matrix_like_bridges(self):
+        array = np.arange(6).reshape(2, 3)
+        tensor = to_torch(array)
+        # numpy arrays and CPU tensors share memory in both directions
+        array[0, 0] = 100
+        self.assertEqual(tensor[0, 0].item(), 100)
+        self.assertIs(to_numpy(array), array)
+        self.assertTrue(np.array_equal(to_numpy(tensor), array))
+        self.assertIs(to_torch(tensor), tensor)
+
+        self.assertEqual(to_torch([[1, 2]], torch.long).dtype, torch.long)
+        self.assertEqual(to_torch(array, torch.float).dtype, torch.float)
+        self.assertEqual(to_numpy([[1, 2]], np.int32).dtype, np.int32)
+
     def test_state(self):
         converter_states = {"to_numpy": True, "to_torch": False}
         converter: Converter = Converter(converter_states)
@@ -20,6 +20,8 @@ import unittest
 from typing import List, Tuple
 
 from forte.data.data_pack import DataPack
+from forte.data.ontology.top import Annotation
+from forte.data.span import Span
 from forte.pipeline import Pipeline
 from forte.utils import utils
 from ft.onto.base_ontology import (
@@ -220,6 +222,84 @@ class DataPackTest(unittest.TestCase):
             len(list(self.data_pack.get_data(Sentence))), num_sent - 1
         )
 
+    def test_get_entries_of_sub_types(self):
+        num_annotations = len(list(self.data_pack.get_entries_of(Annotation)))
+        num_sent = len(list(self.data_pack.get(Sentence)))
+
+        # The cached sub type index of the super types should be refreshed
+        # when entries of a sub type are added or deleted.
+        sentence = Sentence(self.data_pack, 0, 1)
+        self.data_pack.add_entry(sentence)
+        self.assertEqual(
+            len(list(self.data_pack.get_entries_of(Annotation))),
+            num_annotations + 1,
+        )
+        self.assertEqual(len(list(self.data_pack.get(Sentence))), num_sent + 1)
+
+        self.data_pack.delete_entry(sentence)
+        self.assertEqual(
+            len(list(self.data_pack.get_entries_of(Annotation))),
+            num_annotations,
+        )
+
+    def test_get_links_from_node(self):
+        link = next(self.data_pack.get(PredicateLink))
+        self.assertIn(
+            link.tid,
+            [l.tid for l in self.data_pack.get_links_by_parent(link.parent)],
+        )
+        self.assertIn(
+            link.tid,
+            [l.tid for l in self.data_pack.get_links_by_child(link.child)],
+        )
+
+        # Looking up nodes without links should not grow the link index.
+        parent_index = self.data_pack._index._link_index["parent_index"]
+        num_keys = len(parent_index)
+        for token in self.data_pack.get(Token):
+            self.data_pack.get_links_by_parent(token)
+        self.assertEqual(len(parent_index), num_keys)
+
+    def test_group_index(self):
+        groups = list(self.data_pack.get(CoreferenceGroup))
+        self.data_pack._index.build_group_index(groups)
+        for group in groups:
+            for member in group.get_members():
+                self.assertIn(
+                    group.tid, self.data_pack._index.group_index(member.tid)
+                )
+
+        # Looking up entries without groups should not grow the group index.
+        group_index = self.data_pack._index._group_index
+        num_keys = len(group_index)
+        for token in self.data_pack.get(Token):
+            self.assertEqual(
+                self.data_pack._index.group_index(token.tid), set()
+            )
+        self.assertEqual(len(group_index), num_keys)
+
+    def test_get_original_span(self):
+        pack = DataPack()
+        pack.set_text(
+            "He plays in the park",
+            lambda _: [(Span(0, 2), "She"), (Span(16, 20), "garden")],
+        )
+        self.assertEqual(pack.text, "She plays in the garden")
+        for processed_span, original_span in (
+            (Span(0, 9), Span(0, 8)),
+            (Span(4, 9), Span(3, 8)),
+            (Span(17, 23), Span(16, 20)),
+        ):
+            self.assertEqual(
+                pack.get_original_span(processed_span), original_span
+            )
+
+        # the column form of the replace operations is not serialized
+        pack = DataPack.from_string(pack.to_string())
+        self.assertNotIn("_DataPack__replace_back_ops", pack.to_string())
+        self.assertEqual(pack.get_original_span(Span(4, 9)), Span(3, 8))
+        self.assertEqual(pack.get_original_text(), "He plays in the park")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -17,7 +17,8 @@ Unit tests for data store related operations.
 
 import logging
 import unittest
-from sortedcontainers import SortedList
+
+import numpy as np
 
 from forte.data.data_store import DataStore
 
@@ -41,125 +42,75 @@ class DataStoreTest(unittest.TestCase):
                 "classification": 7,
                 "classifications": 8,
             },
+            "forte.data.ontology.core.Entry": {},
         }
-        # The order is [Document, Sentence]. Initialize 2 entries in each list.
-        # Document entries have tid 1234, 3456.
-        # Sentence entries have tid 9999, 1234567.
-        # The type id for Document is 0, Sentence is 1.
-
-        self.data_store._DataStore__type_index_dict = {
-            "ft.onto.base_ontology.Document": 0,
-            "ft.onto.base_ontology.Sentence": 1,
-            "forte.data.ontology.core.Entry": 2,
-        }
+        # Add document entries with tid 1234, 3456 and sentence entries with
+        # tid 9999, 1234567. The type id for Document is 0, Sentence is 1.
+        tids = iter([1234, 3456, 9999, 1234567])
+        self.data_store._new_tid = lambda: next(tids)
 
-        self.data_store._DataStore__elements = [
-            SortedList(
-                [
-                    [
-                        0,
-                        5,
-                        1234,
-                        "ft.onto.base_ontology.Document",
-                        None,
-                        "Postive",
-                        None,
-                    ],
-                    [
-                        10,
-                        25,
-                        3456,
-                        "ft.onto.base_ontology.Document",
-                        "Doc class A",
-                        "Negative",
-                        "Class B",
-                    ],
-                ],
-            ),
-            SortedList(
-                [
-                    [
-                        6,
-                        9,
-                        9999,
-                        "ft.onto.base_ontology.Sentence",
-                        "teacher",
-                        1,
-                        "Postive",
-                        None,
-                        None,
-                    ],
-                    [
-                        55,
-                        70,
-                        1234567,
-                        "ft.onto.base_ontology.Sentence",
-                        None,
-                        None,
-                        "Negative",
-                        "Class C",
-                        "Class D",
-                    ],
-                ],
-            ),
-            # empty list corresponds to Entry, test only
-            [],
-        ]
-        self.data_store._DataStore__entry_dict = {
-            1234: [
-                0,
-                5,
-                1234,
-                "ft.onto.base_ontology.Document",
-                None,
-                "Postive",
-                None,
-            ],
-            3456: [
-                10,
-                25,
-                3456,
-                "ft.onto.base_ontology.Document",
-                "Doc class A",
-                "Negative",
-                "Class B",
-            ],
-            9999: [
-                6,
-                9,
-                9999,
-                "ft.onto.base_ontology.Sentence",
-                "teacher",
-                1,
-                "Postive",
-                None,
-                None,
-            ],
-            1234567: [
-                55,
-                70,
-                1234567,
-                "ft.onto.base_ontology.Sentence",
-                None,
-                None,
-                "Negative",
-                "Class C",
-                "Class D",
-            ],
-        }
+        doc_1 = self.data_store.add_annotation_raw(
+            "ft.onto.base_ontology.Document", 0, 5
+        )
+        doc_2 = self.data_store.add_annotation_raw(
+            "ft.onto.base_ontology.Document", 10, 25
+        )
+        sent_1 = self.data_store.add_annotation_raw(
+            "ft.onto.base_ontology.Sentence", 6, 9
+        )
+        sent_2 = self.data_store.add_annotation_raw(
+            "ft.onto.base_ontology.Sentence", 55, 70
+        )
+        # entries added by the tests get uuid tids again
+        del self.data_store._new_tid
+
+        for tid, attr_values in (
+            (doc_1, [None, "Postive", None]),
+            (doc_2, ["Doc class A", "Negative", "Class B"]),
+            (sent_1, ["teacher", 1, "Postive", None, None]),
+            (sent_2, [None, None, "Negative", "Class C", "Class D"]),
+        ):
+            for attr_id, value in enumerate(attr_values, 4):
+                self.data_store.set_attr(tid, attr_id, value)
+
+        # empty columns corresponds to Entry, test only
+        self.data_store._get_type_id("forte.data.ontology.core.Entry")
 
     def test_add_annotation_raw(self):
-        # # test add Document entry
-        # self.data_store.add_annotation_raw(0, 1, 5)
-        # # test add Sentence entry
-        # self.data_store.add_annotation_raw(1, 5, 8)
-        # num_doc = len(self.data_store._DataStore__elements[0])
-        # num_sent = len(self.data_store._DataStore__elements[1])
+        # test add Document entry
+        self.data_store.add_annotation_raw(
+            "ft.onto.base_ontology.Document", 1, 5
+        )
+        # test add Sentence entry
+        self.data_store.add_annotation_raw(
+            "ft.onto.base_ontology.Sentence", 5, 8
+        )
+        num_doc = self.data_store._DataStore__elements[0].size
+        num_sent = self.data_store._DataStore__elements[1].size
 
-        # self.assertEqual(num_doc, 3)
-        # self.assertEqual(num_sent, 3)
-        # self.assertEqual(len(self.data_store._DataStore__entry_dict), 6)
-        pass
+        self.assertEqual(num_doc, 3)
+        self.assertEqual(num_sent, 3)
+        self.assertEqual(len(self.data_store._DataStore__entry_dict), 6)
+
+        # the new Document is iterated in the sorted position
+        begins = [
+            doc[0]
+            for doc in self.data_store.get("ft.onto.base_ontology.Document")
+        ]
+        self.assertEqual(begins, [0, 1, 10])
+
+    def test_add_annotation_raw_grow(self):
+        for i in range(100):
+            self.data_store.add_annotation_raw(
+                "ft.onto.base_ontology.Sentence", 100 - i, 200
+            )
+        sents = list(self.data_store.get("ft.onto.base_ontology.Sentence"))
+        self.assertEqual(len(sents), 102)
+        self.assertEqual([s[0] for s in sents[:3]], [1, 2, 3])
+        # attributes survive the reallocation of the columns
+        self.assertEqual(
+            self.data_store.get_attribute(9999, "speaker"), "teacher"
+        )
 
     def test_get_attr(self):
         speaker = self.data_store.get_attribute(9999, "speaker")
@@ -189,6 +140,12 @@ class DataStoreTest(unittest.TestCase):
         self.assertEqual(speaker, "student")
         self.assertEqual(doc_class, "Class D")
 
+        # sequence values are stored as a single attribute value
+        self.data_store.set_attribute(3456, "classifications", ["A", "B"])
+        self.assertEqual(
+            self.data_store.get_attribute(3456, "classifications"), ["A", "B"]
+        )
+
         # Entry with such tid does not exist
         with self.assertRaisesRegex(KeyError, "Entry with tid 1111 not found."):
             self.data_store.set_attribute(1111, "speaker", "human")
@@ -200,27 +157,26 @@ class DataStoreTest(unittest.TestCase):
             self.data_store.set_attribute(9999, "speak", "human")
 
     def test_get_entry(self):
-        # sent = self.data_store.get_entry(1234567)
-        # self.assertEqual(
-        #     sent[0],
-        #     [
-        #         55,
-        #         70,
-        #         1234567,
-        #         1,
-        #         None,
-        #         None,
-        #         "Negative",
-        #         "Class C",
-        #         "Class D",
-        #     ],
-        # )
+        sent = self.data_store.get_entry(1234567)
+        self.assertEqual(
+            sent[0],
+            [
+                55,
+                70,
+                1234567,
+                "ft.onto.base_ontology.Sentence",
+                None,
+                None,
+                "Negative",
+                "Class C",
+                "Class D",
+            ],
+        )
+        self.assertEqual(sent[1], 1)
 
-        # # Entry with such tid does not exist
-        # with self.assertRaises(ValueError):
-        #     for doc in self.data_store.get_entry(1111):
-        #         print(doc)
-        pass
+        # Entry with such tid does not exist
+        with self.assertRaises(KeyError):
+            self.data_store.get_entry(1111)
 
     def test_get(self):
         # get document entries
@@ -238,6 +194,52 @@ class DataStoreTest(unittest.TestCase):
         instances = list(self.data_store.get("forte.data.ontology.core.Entry", include_sub_type=False))
         self.assertEqual(len(instances), 0)
 
+    def test_get_attrs(self):
+        attrs = self.data_store.get_attrs(
+            "ft.onto.base_ontology.Document", [5, 4]
+        )
+        self.assertEqual(
+            attrs.tolist(), [["Postive", None], ["Negative", "Doc class A"]]
+        )
+
+        # the entries follow the sorted order
+        self.data_store.add_annotation_raw(
+            "ft.onto.base_ontology.Sentence", 0, 3
+        )
+        attrs = self.data_store.get_attrs(
+            "ft.onto.base_ontology.Sentence", [4, 6, 8]
+        )
+        self.assertEqual(
+            attrs.tolist(),
+            [
+                [None, None, None],
+                ["teacher", "Postive", None],
+                [None, "Negative", "Class D"],
+            ],
+        )
+
+        # the sub-types are read by attribute name
+        self.data_store._type_attributes[
+            "forte.data.ontology.top.Annotation"
+        ] = {"sentiment": 4}
+        self.data_store._get_type_id("forte.data.ontology.top.Annotation")
+        attrs = self.data_store.get_attrs(
+            "forte.data.ontology.top.Annotation", [4], include_sub_type=True
+        )
+        self.assertEqual(
+            attrs.tolist(),
+            [["Postive"], ["Negative"], [None], ["Postive"], ["Negative"]],
+        )
+        self.assertEqual(
+            self.data_store.get_attrs(
+                "forte.data.ontology.core.Entry", [], include_sub_type=True
+            ).shape,
+            (5, 0),
+        )
+
+        with self.assertRaises(KeyError):
+            self.data_store.get_attrs("ft.onto.base_ontology.Document", [8])
+
     def test_delete_entry(self):
         # # In test_add_annotation_raw(), we add 2 entries. So 6 in total.
         # self.data_store.delete_entry(1234567)
@@ -257,34 +259,84 @@ class DataStoreTest(unittest.TestCase):
         #         print(doc)
         pass
 
+    def test_add_annotations_raw(self):
+        tids = self.data_store.add_annotations_raw(
+            "ft.onto.base_ontology.Sentence",
+            np.array([30, 0, 30]),
+            np.array([40, 3, 35]),
+        )
+        self.assertEqual(len(tids), 3)
+        self.assertEqual(len(self.data_store._DataStore__entry_dict), 7)
+        spans = [
+            (s[0], s[1], s[2])
+            for s in self.data_store.get("ft.onto.base_ontology.Sentence")
+        ]
+        self.assertEqual(
+            spans,
+            [
+                (0, 3, tids[1]),
+                (6, 9, 9999),
+                (30, 35, tids[2]),
+                (30, 40, tids[0]),
+                (55, 70, 1234567),
+            ],
+        )
+
+        # sorting many rows at once gives the same order as merging few rows
+        begins = np.arange(200) % 7
+        self.data_store.add_annotations_raw(
+            "ft.onto.base_ontology.Document", begins, begins + 1
+        )
+        docs = list(self.data_store.get("ft.onto.base_ontology.Document"))
+        self.assertEqual(len(docs), 202)
+        self.assertEqual(
+            [d[:2] for d in docs], sorted(d[:2] for d in docs)
+        )
+
+        with self.assertRaises(ValueError):
+            self.data_store.add_annotations_raw(
+                "ft.onto.base_ontology.Document", np.array([1]), np.array([])
+            )
+
     def test_next_entry(self):
-        # next_ent = self.next_entry(1234)
-        # self.assertEqual(
-        #     next_ent,
-        #     [
-        #         10,
-        #         25,
-        #         3456,
-        #         "ft.onto.base_ontology.Document",
-        #         "Doc class A",
-        #         "Negative",
-        #         "Class B",
-        #     ],
-        # )
-        # prev_ent = self.prev_entry(3456)
-        # self.assertEqual(
-        #     prev_ent,
-        #     [
-        #         0,
-        #         5,
-        #         1234,
-        #         "ft.onto.base_ontology.Document",
-        #         None,
-        #         "Postive",
-        #         None,
-        #     ],
-        # )
-        pass
+        next_ent = self.data_store.next_entry(1234)
+        self.assertEqual(
+            next_ent,
+            [
+                10,
+                25,
+                3456,
+                "ft.onto.base_ontology.Document",
+                "Doc class A",
+                "Negative",
+                "Class B",
+            ],
+        )
+        prev_ent = self.data_store.prev_entry(3456)
+        self.assertEqual(
+            prev_ent,
+            [
+                0,
+                5,
+                1234,
+                "ft.onto.base_ontology.Document",
+                None,
+                "Postive",
+                None,
+            ],
+        )
+
+        # the order is updated after new entries are added
+        tid = self.data_store.add_annotation_raw(
+            "ft.onto.base_ontology.Document", 3, 4
+        )
+        self.assertEqual(self.data_store.next_entry(1234)[2], tid)
+        self.assertEqual(self.data_store.prev_entry(3456)[2], tid)
+
+        with self.assertRaises(IndexError):
+            self.data_store.prev_entry(1234)
+        with self.assertRaises(IndexError):
+            self.data_store.next_entry(3456)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,119 @@
+# Copyright 2022 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for Alphabet used by the vocabulary processors.
+"""
+
+import pickle
+import tempfile
+import unittest
+from collections import Counter
+
+import numpy as np
+
+from ddt import ddt, data
+
+from forte.processors.misc import Alphabet
+
+
+@ddt
+class AlphabetTest(unittest.TestCase):
+    def setUp(self):
+        self.alphabet = Alphabet(
+            "word", Counter({"apple": 3, "Banana": 2, "cherry": 1})
+        )
+
+    def test_get_instances(self):
+        indices = [
+            self.alphabet.get_index(w) for w in ["cherry", "apple", "Banana"]
+        ]
+        self.assertEqual(
+            self.alphabet.get_instances(indices).tolist(),
+            ["cherry", "apple", "Banana"],
+        )
+        self.assertEqual(
+            self.alphabet.get_instances(np.array([indices])).shape, (1, 3)
+        )
+        for index in indices:
+            self.assertEqual(
+                self.alphabet.get_instances([index])[0],
+                self.alphabet.get_instance(index),
+            )
+
+        # instances added after closing are visible to batch look-ups
+        self.alphabet.add("durian")
+        index = self.alphabet.get_index("durian")
+        self.assertEqual(self.alphabet.get_instances([index])[0], "durian")
+
+        with self.assertRaises(IndexError):
+            self.alphabet.get_instances([self.alphabet.size()])
+
+    def test_pickle(self):
+        # Look-ups do not add to the pickled state.
+        state_size = len(pickle.dumps(self.alphabet))
+        self.alphabet.get_instances([4])
+        for query in ["DURIAN", "Elderberry", "fig"]:
+            self.alphabet.get_index(query)
+        self.assertEqual(len(pickle.dumps(self.alphabet)), state_size)
+
+        # Alphabets pickled by older versions do not have the array copy.
+        del self.alphabet.__dict__["_instances_frozen"]
+        loaded = pickle.loads(pickle.dumps(self.alphabet))
+        self.assertEqual(loaded.instances, self.alphabet.instances)
+        self.assertEqual(loaded.get_instances([4]).tolist(), ["apple"])
+        self.assertEqual(loaded.get_index("APPLE"), 4)
+        loaded.add("durian")
+        self.assertEqual(
+            loaded.get_instances([loaded.get_index("durian")]).tolist(),
+            ["durian"],
+        )
+
+    def test_get_index_ignore_case(self):
+        self.assertEqual(self.alphabet.get_index("APPLE"), 4)
+        self.assertEqual(self.alphabet.get_index("Apple"), 4)
+        self.assertEqual(
+            self.alphabet.get_index("BANANA"), self.alphabet.unk_id
+        )
+        self.assertEqual(self.alphabet.get_index("Banana"), 5)
+
+        # Adding an instance changes the result of the lower-cased fallback.
+        self.alphabet.add("banana")
+        self.assertEqual(self.alphabet.get_index("BANANA"), 7)
+
+        self.alphabet.ignore_case_in_query = False
+        self.assertEqual(self.alphabet.get_index("APPLE"), self.alphabet.unk_id)
+
+    @data("json", "pickle")
+    def test_save_load(self, serialize_method):
+        with tempfile.TemporaryDirectory() as output_dir:
+            self.alphabet.save(output_dir, serialize_method=serialize_method)
+            loaded = Alphabet("word")
+            loaded.load(output_dir, serialize_method=serialize_method)
+
+        self.assertEqual(loaded.instances, self.alphabet.instances)
+        self.assertEqual(loaded.instance2index, self.alphabet.instance2index)
+        self.assertFalse(loaded.keep_growing)
+        self.assertEqual(loaded.get_index("apple"), 4)
+        self.assertEqual(
+            loaded.get_instances([4, 6]).tolist(), ["apple", "cherry"]
+        )
+
+    def test_save_unsupported(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            with self.assertRaises(NotImplementedError):
+                self.alphabet.save(output_dir, serialize_method="yaml")
+
+
+if __name__ == "__main__":
+    unittest.main()